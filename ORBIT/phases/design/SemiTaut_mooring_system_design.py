@@ -5,7 +5,6 @@ __copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
 __maintainer__ = "Jake Nunemaker"
 __email__ = "jake.nunemaker@nrel.gov & rebecca.fuchs@nrel.gov"
 
-from scipy.interpolate import interp1d
 import numpy as np
 
 from ORBIT.phases.design import DesignPhase
@@ -74,6 +73,9 @@ class SemiTautMooringSystemDesign(DesignPhase):
         Returns the mooring line length and mass.
         """
 
+        # Deferred to keep scipy off the module import path
+        from scipy.interpolate import interp1d
+
         depth = self.config["site"]["depth"]
 
         # Input hybrid mooring system design from Cooperman et al. (2022), https://www.nrel.gov/docs/fy22osti/82341.pdf 'Assessment of Offshore Wind Energy Leasing Areas for Humboldt and Moorow Bay Wind Energy Areas, California
@@ -113,6 +115,8 @@ class SemiTautMooringSystemDesign(DesignPhase):
         review. Should be revised when this module is overhauled in the future.
         """
 
+        from scipy.interpolate import interp1d
+
         if self.anchor_type == "Drag Embedment":
             self.anchor_mass = 20 # t.  This should be updated, but I don't have updated data right now for this.
             # Input hybrid mooring system design from Cooperman et al. (2022), https://www.nrel.gov/docs/fy22osti/82341.pdf 'Assessment of Offshore Wind Energy Leasing Areas for Humboldt and Moorow Bay Wind Energy Areas, California
@@ -126,6 +130,8 @@ class SemiTautMooringSystemDesign(DesignPhase):
 
     def determine_mooring_line_cost(self):
         """Returns cost of one line mooring line."""
+        from scipy.interpolate import interp1d
+
         # Input hybrid mooring system design from Cooperman et al. (2022), https://www.nrel.gov/docs/fy22osti/82341.pdf 'Assessment of Offshore Wind Energy Leasing Areas for Humboldt and Moorow Bay Wind Energy Areas, California
         depths = np.array([500, 750, 1000, 1250, 1500]) # [m]
         total_line_costs = np.array([826598, 1221471, 1682208, 2380035, 3229700]) # [USD]
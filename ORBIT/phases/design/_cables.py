@@ -10,7 +10,6 @@ import math
 from collections import Counter, OrderedDict
 
 import numpy as np
-from scipy.optimize import fsolve
 from ORBIT.core.library import extract_library_specs
 from ORBIT.phases.design import DesignPhase
 
@@ -384,6 +383,9 @@ class CableSystem(DesignPhase):
             Catenary length.
         """
 
+        # Deferred to keep scipy off the module import path
+        from scipy.optimize import fsolve
+
         a = fsolve(self._catenary, 8, (d, h))
 
         x = np.linspace(0, h)
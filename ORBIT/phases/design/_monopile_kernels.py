@@ -0,0 +1,438 @@
+"""Scalar arithmetic kernels used by the `MonopileDesign` class."""
+
+__author__ = "Jake Nunemaker"
+__copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
+__maintainer__ = "Jake Nunemaker"
+__email__ = "jake.nunemaker@nrel.gov"
+
+
+from math import pi, cos, log, acos, sqrt, copysign
+from functools import lru_cache
+
+try:
+    from numba import njit, prange
+
+    NUMBA = True
+
+except ImportError:
+
+    NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement for `numba.njit` if numba isn't installed."""
+
+        def wrap(func):
+            return func
+
+        if args and callable(args[0]):
+            return args[0]
+
+        return wrap
+
+
+#: Base of the 50 year extreme windspeed factor, the probability term of
+#: Arany & Bhattacharya (2016), Equation 27. Depends on nothing, so it is
+#: evaluated once at import.
+_EXTREME_WS_BASE = -log(1 - 0.98 ** (1 / 52596))
+
+
+@lru_cache(maxsize=16)
+def extreme_ws_factor(shape_factor):
+    """
+    Returns the 50 year extreme windspeed factor for a Weibull shape
+    factor. Memoized as the factor is constant for a given shape factor.
+    """
+
+    return _EXTREME_WS_BASE ** (1 / shape_factor)
+
+
+@njit(cache=True, fastmath=True)
+def pile_diam_equation(Dp, yield_stress, material_factor, M_50y):
+    """Kernel for :py:meth:`MonopileDesign.pile_diam_equation`."""
+
+    A = (yield_stress * pi) / (4 * material_factor * M_50y)
+    res = A * ((0.99 * Dp - 0.00635) ** 3) * (0.00635 + 0.01 * Dp) - Dp
+
+    return res
+
+
+@njit(cache=True, fastmath=True)
+def pile_diam_equation_jac(Dp, yield_stress, material_factor, M_50y):
+    """Kernel for :py:meth:`MonopileDesign.pile_diam_equation_jac`."""
+
+    A = (yield_stress * pi) / (4 * material_factor * M_50y)
+    u = 0.99 * Dp - 0.00635
+    v = 0.00635 + 0.01 * Dp
+
+    return A * (3 * 0.99 * u**2 * v + 0.01 * u**3) - 1
+
+
+@njit(cache=True)
+def _cbrt(x):
+    """Real cube root."""
+
+    return copysign(abs(x) ** (1 / 3), x)
+
+
+@njit(cache=True)
+def _nearest_root(x, target, best, err):
+    """
+    Root-candidate bookkeeping for :py:func:`solve_quartic`. Keeps the
+    positive candidate nearest `target`, returning the updated
+    ``(best, err)`` pair.
+    """
+
+    if x > 0 and abs(x - target) < err:
+        return x, abs(x - target)
+
+    return best, err
+
+
+@njit(cache=True)
+def solve_quartic(a4, a3, a2, a1, a0, target):
+    """
+    Closed-form (Ferrari) solution of
+    ``a4*x^4 + a3*x^3 + a2*x^2 + a1*x + a0 = 0``, returning the positive
+    real root nearest `target`. The pile diameter equation always carries
+    a spurious real root just below zero, so non-positive candidates are
+    never physical. Returns -1 if no positive real root exists.
+    """
+
+    b = a3 / a4
+    c = a2 / a4
+    d = a1 / a4
+    e = a0 / a4
+
+    # Depressed quartic y^4 + p*y^2 + q*y + r with x = y - b/4
+    p = c - 3 * b * b / 8
+    q = d - b * c / 2 + b**3 / 8
+    r = e - b * d / 4 + b * b * c / 16 - 3 * b**4 / 256
+
+    # Largest real root of the resolvent cubic
+    # m^3 + p*m^2 + (p^2/4 - r)*m - q^2/8 = 0
+    cc = p * p / 4 - r
+    cd = -q * q / 8
+    pt = cc - p * p / 3
+    qt = 2 * p**3 / 27 - p * cc / 3 + cd
+    disc = (qt / 2) ** 2 + (pt / 3) ** 3
+
+    if disc >= 0:
+        sq = sqrt(disc)
+        t = _cbrt(-qt / 2 + sq) + _cbrt(-qt / 2 - sq)
+
+    else:
+        rho = sqrt(-((pt / 3) ** 3))
+        theta = acos(max(-1.0, min(1.0, -qt / 2 / rho)))
+        t = 2 * sqrt(-pt / 3) * cos(theta / 3)
+
+    m = t - p / 3
+
+    best = -1.0
+    err = float("inf")
+
+    if m > 1e-14:
+        # Split into two quadratics y^2 -/+ s*y + (p/2 + m +/- q/(2s))
+        s = sqrt(2 * m)
+        for sign in (1.0, -1.0):
+            qa = p / 2 + m + sign * q / (2 * s)
+            qd = s * s - 4 * qa
+
+            if qd >= 0:
+                sq = sqrt(qd)
+                for y in ((sign * s + sq) / 2, (sign * s - sq) / 2):
+                    best, err = _nearest_root(y - b / 4, target, best, err)
+
+    else:
+        # q ~ 0; biquadratic y^4 + p*y^2 + r = 0
+        qd = p * p - 4 * r
+
+        if qd >= 0:
+            sq = sqrt(qd)
+            for y2 in ((-p + sq) / 2, (-p - sq) / 2):
+                if y2 >= 0:
+                    for y in (sqrt(y2), -sqrt(y2)):
+                        best, err = _nearest_root(y - b / 4, target, best, err)
+
+    return best
+
+
+@njit(cache=True, fastmath=True)
+def _newton(A, D):
+    """
+    Newton iteration on the pile diameter residual
+    ``f(D) = A * u^3 * v - D``, with ``u = 0.99D - 0.00635`` and
+    ``v = 0.00635 + 0.01D``, from initial guess `D`.
+    """
+
+    for _ in range(50):
+        u = 0.99 * D - 0.00635
+        v = 0.00635 + 0.01 * D
+        f = A * u**3 * v - D
+
+        if abs(f) < 1e-10:
+            break
+
+        fprime = A * (3 * 0.99 * u**2 * v + 0.01 * u**3) - 1
+        D -= f / fprime
+
+    return D
+
+
+# No fastmath here: the degenerate-case guards below must not be
+# optimized away; the heavy arithmetic lives in _newton / solve_quartic
+@njit(cache=True)
+def solve_pile_diameter(yield_stress, material_factor, M_50y, guess):
+    """Kernel for :py:meth:`MonopileDesign._solve_pile_diameter`."""
+
+    A = (yield_stress * pi) / (4 * material_factor * M_50y)
+
+    # A * (a*D + b)^3 * (c*D + d) - D = 0, expanded to a quartic
+    a, b = 0.99, -0.00635
+    c, d = 0.01, 0.00635
+    D = solve_quartic(
+        A * a**3 * c,
+        A * (a**3 * d + 3 * a**2 * b * c),
+        A * (3 * a * b * (a * d + b * c)),
+        A * (3 * a * b**2 * d + b**3 * c) - 1,
+        A * b**3 * d,
+        guess,
+    )
+
+    # Fallback if the closed form found no positive real root
+    if D <= 0:
+        D = guess
+
+    D = _newton(A, D)
+
+    # A non-positive result means the polish walked to the spurious
+    # near-zero root; re-solve from the standard initial guess
+    if D <= 0:
+        D = _newton(A, 10.0)
+
+    return D
+
+
+@njit(cache=True, fastmath=True)
+def pile_thickness(Dp):
+    """Kernel for :py:meth:`MonopileDesign.pile_thickness`."""
+
+    tp = 0.00635 + Dp / 100
+
+    return tp
+
+
+@njit(cache=True, fastmath=True)
+def pile_moment(Dp, tp):
+    """Kernel for :py:meth:`MonopileDesign.pile_moment`."""
+
+    Ip = 0.125 * ((Dp - tp) ** 3) * tp * pi
+
+    return Ip
+
+
+@njit(cache=True, fastmath=True)
+def pile_mass(Dp, tp, Lt, density):
+    """Kernel for :py:meth:`MonopileDesign.pile_mass`."""
+
+    # (pi / 4) * (Dp^2 - (Dp - 2 * tp)^2) reduced to pi * tp * (Dp - tp)
+    volume = pi * tp * (Dp - tp) * Lt
+    mass = density * volume / 907.185
+
+    return mass
+
+
+@njit(cache=True, fastmath=True)
+def pile_embedment_length(Ip, monopile_modulus, soil_coefficient):
+    """Kernel for :py:meth:`MonopileDesign.pile_embedment_length`."""
+
+    Lp = 2 * ((monopile_modulus * Ip) / soil_coefficient) ** 0.2
+
+    return Lp
+
+
+@njit(cache=True, fastmath=True)
+def size_pile(
+    Dp, site_depth, airgap, monopile_modulus, soil_coefficient, density
+):
+    """
+    Computes the thickness through mass sizing chain for a solved pile
+    diameter in a single compiled unit.
+
+    Returns
+    -------
+    tuple
+        (thickness, moment, embedment_length, length, mass)
+    """
+
+    tp = pile_thickness(Dp)
+    Ip = pile_moment(Dp, tp)
+    Lp = pile_embedment_length(Ip, monopile_modulus, soil_coefficient)
+    Lt = Lp + site_depth + airgap
+    mt = pile_mass(Dp, tp, Lt, density)
+
+    return tp, Ip, Lp, Lt, mt
+
+
+@njit(cache=True, fastmath=True)
+def thrust_coefficient(rated_windspeed):
+    """Kernel for :py:meth:`MonopileDesign.calculate_thrust_coefficient`."""
+
+    ct = 3.5 * (2 * rated_windspeed + 3.5) / (rated_windspeed**2)
+
+    return 1.0 if ct > 1.0 else ct
+
+
+@lru_cache(maxsize=64)
+def turbine_constants(rotor_diameter, rated_windspeed):
+    """
+    Returns the swept area and thrust coefficient for a turbine spec.
+    Memoized as both depend only on the turbine, not the site, so sweeps
+    that reuse a turbine type compute them once.
+    """
+
+    swept_area = pi * (rotor_diameter / 2) ** 2
+    ct = thrust_coefficient(rated_windspeed)
+
+    return swept_area, ct
+
+
+@njit(cache=True, fastmath=True)
+def extreme_ws_50year(scale_factor, shape_factor):
+    """Kernel for :py:meth:`MonopileDesign.calculate_50year_extreme_ws`."""
+
+    U_50y = scale_factor * _EXTREME_WS_BASE ** (1 / shape_factor)
+
+    return U_50y
+
+
+@njit(cache=True, fastmath=True)
+def extreme_gust_50year(
+    scale_factor, shape_factor, rotor_diameter, rated_windspeed, length_scale
+):
+    """Kernel for :py:meth:`MonopileDesign.calculate_50year_extreme_gust`."""
+
+    U_50y = extreme_ws_50year(scale_factor, shape_factor)
+    U_1y = 0.8 * U_50y
+
+    eog_1 = 1.35 * (U_1y - rated_windspeed)
+    eog_2 = (3.3 * 0.11 * U_1y) / (
+        1 + (0.1 * rotor_diameter) / (length_scale / 8)
+    )
+
+    return eog_1 if eog_1 < eog_2 else eog_2
+
+
+@njit(cache=True, fastmath=True)
+def wind_load_50year(
+    scale_factor,
+    shape_factor,
+    rotor_diameter,
+    rated_windspeed,
+    length_scale,
+    dens,
+):
+    """Kernel for :py:meth:`MonopileDesign.calculate_50year_wind_load`."""
+
+    swept_area = pi * (rotor_diameter / 2) ** 2
+    ct = thrust_coefficient(rated_windspeed)
+    U_eog = extreme_gust_50year(
+        scale_factor,
+        shape_factor,
+        rotor_diameter,
+        rated_windspeed,
+        length_scale,
+    )
+
+    F_50y = 0.5 * dens * swept_area * ct * (rated_windspeed + U_eog) ** 2
+
+    return F_50y
+
+
+@njit(cache=True, fastmath=True)
+def wind_moment_50year(
+    scale_factor,
+    shape_factor,
+    site_depth,
+    rotor_diameter,
+    hub_height,
+    rated_windspeed,
+    length_scale,
+    dens,
+    load_factor,
+):
+    """Kernel for :py:meth:`MonopileDesign.calculate_50year_wind_moment`."""
+
+    F_50y = wind_load_50year(
+        scale_factor,
+        shape_factor,
+        rotor_diameter,
+        rated_windspeed,
+        length_scale,
+        dens,
+    )
+    M_50y = F_50y * (site_depth + hub_height)
+
+    return M_50y * load_factor
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def design_many(
+    scale_factor,
+    site_depth,
+    rotor_diameter,
+    hub_height,
+    rated_windspeed,
+    yield_stress,
+    material_factor,
+    load_factor,
+    dens,
+    shape_factor,
+    length_scale,
+    airgap,
+    monopile_modulus,
+    soil_coefficient,
+    density,
+    diameter,
+    thickness,
+    moment,
+    embedment_length,
+    length,
+    mass,
+):
+    """
+    Parallel kernel for :py:meth:`MonopileDesign.design_monopile_array`.
+    Designs one monopile per element of the 1-D input arrays, writing the
+    sizing results into the preallocated output arrays. Runs across cores
+    via `numba.prange` when numba is installed.
+    """
+
+    for i in prange(scale_factor.shape[0]):
+        M_50y = wind_moment_50year(
+            scale_factor[i],
+            shape_factor,
+            site_depth[i],
+            rotor_diameter[i],
+            hub_height[i],
+            rated_windspeed[i],
+            length_scale,
+            dens,
+            load_factor,
+        )
+
+        Dp = solve_pile_diameter(yield_stress, material_factor, M_50y, 10.0)
+        tp, Ip, Lp, Lt, mt = size_pile(
+            Dp,
+            site_depth[i],
+            airgap,
+            monopile_modulus,
+            soil_coefficient,
+            density,
+        )
+
+        diameter[i] = Dp
+        thickness[i] = tp
+        moment[i] = Ip
+        embedment_length[i] = Lp
+        length[i] = Lt
+        mass[i] = mt
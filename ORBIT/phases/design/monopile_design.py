@@ -6,12 +6,88 @@ __maintainer__ = "Jake Nunemaker"
 __email__ = "jake.nunemaker@nrel.gov"
 
 
-from math import pi, log
+from math import pi
+from typing import NamedTuple, Optional
+from functools import lru_cache
 
-from scipy.optimize import fsolve
+import numpy as np
 
 from ORBIT.core.defaults import common_costs
 from ORBIT.phases.design import DesignPhase
+from ORBIT.phases.design import _monopile_kernels as kernels
+
+
+class _MonopileParams(NamedTuple):
+    """
+    Optional `MonopileDesign` inputs resolved against their defaults.
+    Built once per configuration so the design methods read typed
+    attributes instead of performing repeated `kwargs.get` lookups.
+    """
+
+    yield_stress: float = 355000000  # Pa
+    material_factor: float = 1.1
+    load_factor: float = 3.375
+    monopile_density: float = 7860  # kg/m3
+    monopile_modulus: float = 200e9  # Pa
+    soil_coefficient: float = 4000000  # N/m3
+    air_density: float = 1.225  # kg/m3
+    weibull_scale_factor: Optional[float] = None  # defaults to mean windspeed
+    weibull_shape_factor: float = 2
+    turb_length_scale: float = 340.2  # m
+    airgap: float = 10  # m
+    monopile_tp_connection_thickness: float = 0.0  # m
+    transition_piece_density: float = 7860  # kg/m3
+    # Defaults to the pile thickness
+    transition_piece_thickness: Optional[float] = None
+    transition_piece_length: float = 25  # m
+
+    @classmethod
+    def from_config(cls, config):
+        """Builds an instance from a config dict, ignoring unused keys."""
+
+        return cls(**{k: v for k, v in config.items() if k in cls._fields})
+
+
+@lru_cache(maxsize=1024)
+def _design_monopile(
+    mean_windspeed,
+    site_depth,
+    rotor_diameter,
+    hub_height,
+    rated_windspeed,
+    params,
+):
+    """
+    Memoized core of :py:meth:`MonopileDesign.design_monopile`. The design
+    is deterministic in its inputs and sweeps commonly revisit identical
+    site/turbine combinations, so repeat calls return the cached sizing.
+
+    Parameters
+    ----------
+    mean_windspeed : int | float
+        Mean wind speed at site (m/s).
+    site_depth : int | float
+        Water depth at site (m).
+    rotor_diameter : int | float
+        Rotor diameter (m).
+    hub_height : int | float
+        Hub height above mean sea level (m).
+    rated_windspeed : int | float
+        Rated windspeed of turbine (m/s).
+    params : _MonopileParams
+        Resolved optional design inputs.
+
+    Returns
+    -------
+    tuple
+        (diameter, thickness, moment, embedment_length, length, mass)
+    """
+
+    designer = MonopileDesign._specialized_designer(
+        rotor_diameter, rated_windspeed
+    )
+
+    return designer(mean_windspeed, site_depth, hub_height, params)
 
 
 class MonopileDesign(DesignPhase):
@@ -75,6 +151,9 @@ class MonopileDesign(DesignPhase):
 
         config = self.initialize_library(config, **kwargs)
         self.config = self.validate_config(config)
+        self._p = _MonopileParams.from_config(
+            self.config.get("monopile_design", {})
+        )
         self._outputs = {}
 
     def run(self):
@@ -83,22 +162,26 @@ class MonopileDesign(DesignPhase):
         :py:meth:`.design_monopile`.
         """
 
-        _kwargs = self.config.get("monopile_design", {})
+        # Optional design parameters were resolved into self._p on
+        # initialization, so they are not re-passed here.
         self._outputs["monopile"] = self.design_monopile(
             mean_windspeed=self.config["site"]["mean_windspeed"],
             site_depth=self.config["site"]["depth"],
             rotor_diameter=self.config["turbine"]["rotor_diameter"],
             hub_height=self.config["turbine"]["hub_height"],
             rated_windspeed=self.config["turbine"]["rated_windspeed"],
-            **_kwargs,
         )
 
         self._outputs["transition_piece"] = self.design_transition_piece(
             self.monopile_sizing["diameter"],
             self.monopile_sizing["thickness"],
-            **_kwargs,
         )
 
+        # Final masses as scalars, so the cost properties don't re-chase
+        # the output dicts on every evaluation
+        self._monopile_mass = self._outputs["monopile"]["mass"]
+        self._tp_mass = self._outputs["transition_piece"]["mass"]
+
     def design_monopile(
         self,
         mean_windspeed,
@@ -150,51 +233,260 @@ class MonopileDesign(DesignPhase):
            Volume 92, 2017, Pages 126-152, ISSN 0267-7261,
         """
 
-        yield_stress = kwargs.get("yield_stress", 355000000)  # PA
-        material_factor = kwargs.get("material_factor", 1.1)
-        M_50y = self.calculate_50year_wind_moment(
-            mean_windspeed=mean_windspeed,
-            site_depth=site_depth,
-            rotor_diameter=rotor_diameter,
-            hub_height=hub_height,
-            rated_windspeed=rated_windspeed,
-            **kwargs,
+        # Optional inputs, pre-resolved in __init__ unless overridden
+        p = _MonopileParams.from_config(kwargs) if kwargs else self._p
+
+        # Monopile sizing, memoized on the full input tuple
+        diameter, thickness, moment, embedment_length, length, mass = (
+            _design_monopile(
+                mean_windspeed,
+                site_depth,
+                rotor_diameter,
+                hub_height,
+                rated_windspeed,
+                p,
+            )
         )
 
-        data = (yield_stress, material_factor, M_50y)
-        monopile = {}
+        monopile = {
+            "diameter": diameter,
+            "thickness": thickness,
+            "moment": moment,
+            "embedment_length": embedment_length,
+            "length": length,
+            "mass": mass,
+            "deck_space": diameter**2,
+            "unit_cost": mass * self.monopile_steel_cost,
+        }
+
+        self.monopile_sizing = monopile
+        return monopile
+
+    def design_monopile_batch(
+        self,
+        mean_windspeed,
+        site_depth,
+        rotor_diameter,
+        hub_height,
+        rated_windspeed,
+        **kwargs,
+    ):
+        """
+        Vectorized equivalent of :py:meth:`.design_monopile` for parameter
+        sweeps. Inputs are broadcast against each other as NumPy arrays and
+        the full sizing chain, including the Newton diameter solve, is
+        evaluated once per array rather than once per site/turbine.
+
+        Parameters
+        ----------
+        mean_windspeed : array_like
+            Mean wind speeds at site (m/s).
+        site_depth : array_like
+            Water depths at site (m).
+        rotor_diameter : array_like
+            Rotor diameters (m).
+        hub_height : array_like
+            Hub heights above mean sea level (m).
+        rated_windspeed : array_like
+            Rated windspeeds of turbine (m/s).
 
-        # Monopile sizing
-        monopile["diameter"] = fsolve(self.pile_diam_equation, 10, args=data)[
-            0
-        ]
-        monopile["thickness"] = self.pile_thickness(monopile["diameter"])
-        monopile["moment"] = self.pile_moment(
-            monopile["diameter"], monopile["thickness"]
+        Returns
+        -------
+        monopile : dict
+            Dictionary of monopile sizing and cost arrays with the same
+            keys as :py:meth:`.design_monopile`.
+        """
+
+        (
+            mean_windspeed,
+            site_depth,
+            rotor_diameter,
+            hub_height,
+            rated_windspeed,
+        ) = np.broadcast_arrays(
+            *(
+                np.asarray(arr, dtype=float)
+                for arr in (
+                    mean_windspeed,
+                    site_depth,
+                    rotor_diameter,
+                    hub_height,
+                    rated_windspeed,
+                )
+            )
+        )
+
+        # Optional inputs, pre-resolved in __init__ unless overridden
+        p = _MonopileParams.from_config(kwargs) if kwargs else self._p
+        scale_factor = (
+            mean_windspeed
+            if p.weibull_scale_factor is None
+            else p.weibull_scale_factor
+        )
+
+        # 50 year extreme wind moment chain
+        U_50y = scale_factor * kernels.extreme_ws_factor(
+            p.weibull_shape_factor
+        )
+        U_1y = 0.8 * U_50y
+
+        U_eog = np.minimum(
+            1.35 * (U_1y - rated_windspeed),
+            (3.3 * 0.11 * U_1y)
+            / (1 + (0.1 * rotor_diameter) / (p.turb_length_scale / 8)),
         )
-        monopile["embedment_length"] = self.pile_embedment_length(
-            monopile["moment"], **kwargs
+
+        ct = np.minimum(
+            3.5 * (2 * rated_windspeed + 3.5) / (rated_windspeed**2), 1
+        )
+        swept_area = pi * (rotor_diameter / 2) ** 2
+
+        F_50y = (
+            0.5
+            * p.air_density
+            * swept_area
+            * ct
+            * (rated_windspeed + U_eog) ** 2
         )
+        M_50y = F_50y * (site_depth + hub_height) * p.load_factor
+
+        # Newton solve for all diameters in lockstep
+        A = (p.yield_stress * pi) / (4 * p.material_factor * M_50y)
+        Dp = np.full(A.shape, 10.0)
+        for _ in range(50):
+            u = 0.99 * Dp - 0.00635
+            v = 0.00635 + 0.01 * Dp
+            f = A * u**3 * v - Dp
+
+            if np.max(np.abs(f)) < 1e-10:
+                break
 
-        # Total length
-        airgap = kwargs.get("airgap", 10)  # m
-        monopile["length"] = monopile["embedment_length"] + site_depth + airgap
-        monopile["mass"] = self.pile_mass(
-            Dp=monopile["diameter"],
-            tp=monopile["thickness"],
-            Lt=monopile["length"],
-            **kwargs,
+            Dp -= f / (A * (3 * 0.99 * u**2 * v + 0.01 * u**3) - 1)
+
+        monopile = {}
+        monopile["diameter"] = Dp
+        monopile["thickness"] = self.pile_thickness(Dp)
+        monopile["moment"] = self.pile_moment(Dp, monopile["thickness"])
+        monopile["embedment_length"] = kernels.pile_embedment_length(
+            monopile["moment"], p.monopile_modulus, p.soil_coefficient
         )
 
-        # Deck space
-        monopile["deck_space"] = monopile["diameter"] ** 2
+        monopile["length"] = (
+            monopile["embedment_length"] + site_depth + p.airgap
+        )
+        monopile["mass"] = kernels.pile_mass(
+            Dp, monopile["thickness"], monopile["length"], p.monopile_density
+        )
 
-        # Costs
+        monopile["deck_space"] = Dp**2
         monopile["unit_cost"] = monopile["mass"] * self.monopile_steel_cost
 
-        self.monopile_sizing = monopile
         return monopile
 
+    def design_monopile_array(
+        self,
+        mean_windspeed,
+        site_depth,
+        rotor_diameter,
+        hub_height,
+        rated_windspeed,
+        **kwargs,
+    ):
+        """
+        Compiled-loop equivalent of :py:meth:`.design_monopile_batch`.
+        Designs one monopile per element of the 1-D inputs using the
+        :py:func:`_monopile_kernels.design_many` kernel, which runs in
+        parallel across cores with `numba.prange` when numba is installed
+        and falls back to a serial Python loop otherwise.
+
+        Parameters
+        ----------
+        mean_windspeed : array_like
+            Mean wind speeds at site (m/s).
+        site_depth : array_like
+            Water depths at site (m).
+        rotor_diameter : array_like
+            Rotor diameters (m).
+        hub_height : array_like
+            Hub heights above mean sea level (m).
+        rated_windspeed : array_like
+            Rated windspeeds of turbine (m/s).
+
+        Returns
+        -------
+        monopile : dict
+            Dictionary of monopile sizing and cost arrays with the same
+            keys as :py:meth:`.design_monopile`.
+        """
+
+        (
+            mean_windspeed,
+            site_depth,
+            rotor_diameter,
+            hub_height,
+            rated_windspeed,
+        ) = np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(arr, dtype=float))
+                for arr in (
+                    mean_windspeed,
+                    site_depth,
+                    rotor_diameter,
+                    hub_height,
+                    rated_windspeed,
+                )
+            )
+        )
+
+        # Optional inputs, pre-resolved in __init__ unless overridden
+        p = _MonopileParams.from_config(kwargs) if kwargs else self._p
+        scale_factor = np.ascontiguousarray(
+            np.broadcast_to(
+                (
+                    mean_windspeed
+                    if p.weibull_scale_factor is None
+                    else p.weibull_scale_factor
+                ),
+                mean_windspeed.shape,
+            ),
+            dtype=float,
+        )
+
+        n = mean_windspeed.shape[0]
+        outputs = [np.empty(n) for _ in range(6)]
+
+        kernels.design_many(
+            scale_factor,
+            np.ascontiguousarray(site_depth),
+            np.ascontiguousarray(rotor_diameter),
+            np.ascontiguousarray(hub_height),
+            np.ascontiguousarray(rated_windspeed),
+            p.yield_stress,
+            p.material_factor,
+            p.load_factor,
+            p.air_density,
+            p.weibull_shape_factor,
+            p.turb_length_scale,
+            p.airgap,
+            p.monopile_modulus,
+            p.soil_coefficient,
+            p.monopile_density,
+            *outputs,
+        )
+
+        diameter, thickness, moment, embedment_length, length, mass = outputs
+
+        return {
+            "diameter": diameter,
+            "thickness": thickness,
+            "moment": moment,
+            "embedment_length": embedment_length,
+            "length": length,
+            "mass": mass,
+            "deck_space": diameter**2,
+            "unit_cost": mass * self.monopile_steel_cost,
+        }
+
     def design_transition_piece(self, D_p, t_p, **kwargs):
         """
         Designs transition piece given the results of the monopile design.
@@ -212,18 +504,23 @@ class MonopileDesign(DesignPhase):
             Transition piece design parameters.
         """
 
+        p = _MonopileParams.from_config(kwargs) if kwargs else self._p
+
         # Defaults to a bolted connection
-        t_c = kwargs.get("monopile_tp_connection_thickness", 0.0)
+        t_c = p.monopile_tp_connection_thickness
 
-        dens_tp = kwargs.get("transition_piece_density", 7860)  # kg/m3
-        t_tp = kwargs.get("transition_piece_thickness", t_p)
-        L_tp = kwargs.get("transition_piece_length", 25)
+        dens_tp = p.transition_piece_density  # kg/m3
+        t_tp = (
+            t_p
+            if p.transition_piece_thickness is None
+            else p.transition_piece_thickness
+        )
+        L_tp = p.transition_piece_length
         D_tp = D_p + 2 * (t_c + t_tp)  # Arany 2016, Section 2.2.7
 
         # Arany 2016, Section 2.2.8
-        m_tp = (
-            dens_tp * (D_p + 2 * t_c + t_tp) * pi * t_tp * L_tp
-        ) / 907.185  # t
+        _K = pi * t_tp * L_tp / 907.185
+        m_tp = dens_tp * (D_p + 2 * t_c + t_tp) * _K  # t
 
         tp_design = {
             "thickness": t_tp,
@@ -249,7 +546,9 @@ class MonopileDesign(DesignPhase):
     def total_cost(self):
         """Returns total cost of the substructures and transition pieces."""
 
-        return sum([v for _, v in self.material_cost.items()])
+        mc = self.material_cost
+
+        return mc["monopile"] + mc["transition_piece"]
 
     @property
     def detailed_output(self):
@@ -287,9 +586,7 @@ class MonopileDesign(DesignPhase):
         if not self._outputs:
             raise Exception("Has MonopileDesign been ran yet?")
 
-        num_turbines = self.config["plant"]["num_turbines"]
-
-        return self._outputs["monopile"]["mass"] * num_turbines
+        return self._monopile_mass * self.config["plant"]["num_turbines"]
 
     @property
     def total_tp_mass(self):
@@ -298,9 +595,7 @@ class MonopileDesign(DesignPhase):
         if not self._outputs:
             raise Exception("Has MonopileDesign been ran yet?")
 
-        num_turbines = self.config["plant"]["num_turbines"]
-
-        return self._outputs["transition_piece"]["mass"] * num_turbines
+        return self._tp_mass * self.config["plant"]["num_turbines"]
 
     @property
     def monopile_steel_cost(self):
@@ -355,10 +650,8 @@ class MonopileDesign(DesignPhase):
         """
 
         density = kwargs.get("monopile_density", 7860)  # kg/m3
-        volume = (pi / 4) * (Dp**2 - (Dp - 2 * tp) ** 2) * Lt
-        mass = density * volume / 907.185
 
-        return mass
+        return kernels.pile_mass(Dp, tp, Lt, density)
 
     @staticmethod
     def pile_embedment_length(Ip, **kwargs):
@@ -381,9 +674,9 @@ class MonopileDesign(DesignPhase):
         monopile_modulus = kwargs.get("monopile_modulus", 200e9)  # Pa
         soil_coefficient = kwargs.get("soil_coefficient", 4000000)  # N/m3
 
-        Lp = 2 * ((monopile_modulus * Ip) / soil_coefficient) ** 0.2
-
-        return Lp
+        return kernels.pile_embedment_length(
+            Ip, monopile_modulus, soil_coefficient
+        )
 
     @staticmethod
     def pile_thickness(Dp):
@@ -403,9 +696,7 @@ class MonopileDesign(DesignPhase):
             Pile Wall Thickness (m)
         """
 
-        tp = 0.00635 + Dp / 100
-
-        return tp
+        return kernels.pile_thickness(Dp)
 
     @staticmethod
     def pile_moment(Dp, tp):
@@ -425,9 +716,147 @@ class MonopileDesign(DesignPhase):
             Pile bending moment of inertia
         """
 
-        Ip = 0.125 * ((Dp - tp) ** 3) * tp * pi
+        return kernels.pile_moment(Dp, tp)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _specialized_designer(rotor_diameter, rated_windspeed):
+        """
+        Returns a design function specialized to a turbine signature. The
+        turbine-dependent constants (swept area, thrust coefficient and
+        their product with the rated windspeed) are bound into the
+        function on first call, so repeated sweeps over one turbine type,
+        the most common usage, skip recomputing them per site. The cache
+        is bounded so optimizations that treat the turbine parameters as
+        continuous design variables don't accumulate designers without
+        limit.
+
+        Parameters
+        ----------
+        rotor_diameter : int | float
+            Rotor diameter (m).
+        rated_windspeed : int | float
+            Rated windspeed of turbine (m/s).
+
+        Returns
+        -------
+        designer : callable
+            ``designer(mean_windspeed, site_depth, hub_height, params)``
+            returning (diameter, thickness, moment, embedment_length,
+            length, mass).
+        """
+
+        swept_area, ct = kernels.turbine_constants(
+            rotor_diameter, rated_windspeed
+        )
+
+        def designer(
+            mean_windspeed,
+            site_depth,
+            hub_height,
+            params,
+            _rotor=rotor_diameter,
+            _rated=rated_windspeed,
+            _half_thrust_area=0.5 * swept_area * ct,
+        ):
+            scale_factor = (
+                mean_windspeed
+                if params.weibull_scale_factor is None
+                else params.weibull_scale_factor
+            )
+
+            # 50 year extreme gust with the turbine terms pre-bound
+            U_1y = (
+                0.8
+                * scale_factor
+                * kernels.extreme_ws_factor(params.weibull_shape_factor)
+            )
+            eog_1 = 1.35 * (U_1y - _rated)
+            eog_2 = (3.3 * 0.11 * U_1y) / (
+                1 + (0.1 * _rotor) / (params.turb_length_scale / 8)
+            )
+            U_eog = eog_1 if eog_1 < eog_2 else eog_2
+
+            F_50y = (
+                _half_thrust_area * params.air_density * (_rated + U_eog) ** 2
+            )
+            M_50y = F_50y * (site_depth + hub_height) * params.load_factor
+
+            diameter = MonopileDesign._solve_diameter(
+                params.yield_stress, params.material_factor, round(M_50y, 3)
+            )
+
+            return (
+                diameter,
+                *kernels.size_pile(
+                    diameter,
+                    site_depth,
+                    params.airgap,
+                    params.monopile_modulus,
+                    params.soil_coefficient,
+                    params.monopile_density,
+                ),
+            )
+
+        return designer
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _solve_diameter(yield_stress, material_factor, M_50y):
+        """
+        Cached wrapper around :py:meth:`._solve_pile_diameter`. Identical
+        inputs (with the moment rounded by the caller) return the cached
+        diameter. Each solve starts from the standard initial guess so
+        results never depend on earlier solves in the process.
+
+        Parameters
+        ----------
+        yield_stress : int | float
+            Monopile steel yield stress (Pa).
+        material_factor : int | float
+            Monopile steel material factor.
+        M_50y : int | float
+            50 year extreme wind moment (N-m).
+
+        Returns
+        -------
+        Dp : float
+            Pile diameter (m).
+        """
+
+        return MonopileDesign._solve_pile_diameter(
+            yield_stress, material_factor, M_50y
+        )
+
+    @staticmethod
+    def _solve_pile_diameter(yield_stress, material_factor, M_50y, guess=10.0):
+        """
+        Solves :py:meth:`.pile_diam_equation` for the pile diameter.
+
+        Uses Newton's method with the analytic derivative of the residual,
+        converging quadratically from an initial guess in the expected
+        diameter range (~10 m). Typically converges in 5-6 iterations.
+
+        Parameters
+        ----------
+        yield_stress : int | float
+            Monopile steel yield stress (Pa).
+        material_factor : int | float
+            Monopile steel material factor.
+        M_50y : int | float
+            50 year extreme wind moment (N-m).
+        guess : float
+            Initial guess for the pile diameter (m).
+
+        Returns
+        -------
+        Dp : float
+            Pile diameter (m).
+        """
 
-        return Ip
+        return kernels.solve_pile_diameter(
+            yield_stress, material_factor, M_50y, guess
+        )
 
     @staticmethod
     def pile_diam_equation(Dp, *data):
@@ -449,10 +878,35 @@ class MonopileDesign(DesignPhase):
         """
 
         yield_stress, material_factor, M_50y = data
-        A = (yield_stress * pi) / (4 * material_factor * M_50y)
-        res = A * ((0.99 * Dp - 0.00635) ** 3) * (0.00635 + 0.01 * Dp) - Dp
 
-        return res
+        return kernels.pile_diam_equation(
+            Dp, yield_stress, material_factor, M_50y
+        )
+
+    @staticmethod
+    def pile_diam_equation_jac(Dp, *data):
+        """
+        Analytic derivative of :py:meth:`.pile_diam_equation` with respect
+        to the pile diameter. Suitable as the `fprime` argument of
+        `scipy.optimize.fsolve`, avoiding the extra residual evaluations
+        MINPACK needs to finite-difference the Jacobian.
+
+        Parameters
+        ----------
+        Dp : int | float
+            Pile diameter (m).
+
+        Returns
+        -------
+        res : float
+            Derivative of the reduced equation result.
+        """
+
+        yield_stress, material_factor, M_50y = data
+
+        return kernels.pile_diam_equation_jac(
+            Dp, yield_stress, material_factor, M_50y
+        )
 
     def calculate_50year_wind_moment(
         self,
@@ -492,18 +946,23 @@ class MonopileDesign(DesignPhase):
         """
 
         load_factor = kwargs.get("load_factor", 3.375)
+        dens = kwargs.get("air_density", 1.225)
+        length_scale = kwargs.get("turb_length_scale", 340.2)
+        scale_factor = kwargs.get("weibull_scale_factor", mean_windspeed)
+        shape_factor = kwargs.get("weibull_shape_factor", 2)
 
-        F_50y = self.calculate_50year_wind_load(
-            mean_windspeed=mean_windspeed,
-            rotor_diameter=rotor_diameter,
-            rated_windspeed=rated_windspeed,
-            **kwargs,
+        return kernels.wind_moment_50year(
+            scale_factor,
+            shape_factor,
+            site_depth,
+            rotor_diameter,
+            hub_height,
+            rated_windspeed,
+            length_scale,
+            dens,
+            load_factor,
         )
 
-        M_50y = F_50y * (site_depth + hub_height)
-
-        return M_50y * load_factor
-
     def calculate_50year_wind_load(
         self, mean_windspeed, rotor_diameter, rated_windspeed, **kwargs
     ):
@@ -528,20 +987,22 @@ class MonopileDesign(DesignPhase):
         """
 
         dens = kwargs.get("air_density", 1.225)
-        swept_area = pi * (rotor_diameter / 2) ** 2
-
-        ct = self.calculate_thrust_coefficient(rated_windspeed=rated_windspeed)
+        length_scale = kwargs.get("turb_length_scale", 340.2)
+        scale_factor = kwargs.get("weibull_scale_factor", mean_windspeed)
+        shape_factor = kwargs.get("weibull_shape_factor", 2)
 
-        U_eog = self.calculate_50year_extreme_gust(
-            mean_windspeed=mean_windspeed,
-            rated_windspeed=rated_windspeed,
-            rotor_diameter=rotor_diameter,
-            **kwargs,
+        swept_area, ct = kernels.turbine_constants(
+            rotor_diameter, rated_windspeed
+        )
+        U_eog = kernels.extreme_gust_50year(
+            scale_factor,
+            shape_factor,
+            rotor_diameter,
+            rated_windspeed,
+            length_scale,
         )
 
-        F_50y = 0.5 * dens * swept_area * ct * (rated_windspeed + U_eog) ** 2
-
-        return F_50y
+        return 0.5 * dens * swept_area * ct * (rated_windspeed + U_eog) ** 2
 
     @staticmethod
     def calculate_thrust_coefficient(rated_windspeed):
@@ -560,9 +1021,7 @@ class MonopileDesign(DesignPhase):
             Coefficient of thrust.
         """
 
-        ct = min([3.5 * (2 * rated_windspeed + 3.5) / (rated_windspeed**2), 1])
-
-        return ct
+        return kernels.thrust_coefficient(rated_windspeed)
 
     @staticmethod
     def calculate_50year_extreme_ws(mean_windspeed, **kwargs):
@@ -587,11 +1046,8 @@ class MonopileDesign(DesignPhase):
 
         scale_factor = kwargs.get("weibull_scale_factor", mean_windspeed)
         shape_factor = kwargs.get("weibull_shape_factor", 2)
-        U_50y = scale_factor * (-log(1 - 0.98 ** (1 / 52596))) ** (
-            1 / shape_factor
-        )
 
-        return U_50y
+        return scale_factor * kernels.extreme_ws_factor(shape_factor)
 
     def calculate_50year_extreme_gust(
         self, mean_windspeed, rotor_diameter, rated_windspeed, **kwargs
@@ -619,16 +1075,13 @@ class MonopileDesign(DesignPhase):
         """
 
         length_scale = kwargs.get("turb_length_scale", 340.2)
+        scale_factor = kwargs.get("weibull_scale_factor", mean_windspeed)
+        shape_factor = kwargs.get("weibull_shape_factor", 2)
 
-        U_50y = self.calculate_50year_extreme_ws(mean_windspeed, **kwargs)
-        U_1y = 0.8 * U_50y
-
-        U_eog = min(
-            [
-                (1.35 * (U_1y - rated_windspeed)),
-                (3.3 * 0.11 * U_1y)
-                / (1 + (0.1 * rotor_diameter) / (length_scale / 8)),
-            ]
+        return kernels.extreme_gust_50year(
+            scale_factor,
+            shape_factor,
+            rotor_diameter,
+            rated_windspeed,
+            length_scale,
         )
-
-        return U_eog
@@ -10,8 +10,6 @@ __email__ = (
 
 from math import sqrt
 
-from scipy.interpolate import interp1d
-
 from ORBIT.phases.design import DesignPhase
 
 
@@ -150,6 +148,9 @@ class MooringSystemDesign(DesignPhase):
 
         """
 
+        # Deferred to keep scipy off the module import path
+        from scipy.interpolate import interp1d
+
         # Add extra fixed line length for drag embedments
         if self.anchor_type == "Drag Embedment":
             fixed = self._design.get("drag_embedment_fixed_length", 500)
@@ -223,6 +224,8 @@ class MooringSystemDesign(DesignPhase):
         different anchors.
         """
 
+        from scipy.interpolate import interp1d
+
         if self.mooring_type == "SemiTaut":
 
             if self.anchor_type == "Drag Embedment":
@@ -257,6 +260,8 @@ class MooringSystemDesign(DesignPhase):
     def line_cost(self):
         """Returns cost of one line mooring line."""
 
+        from scipy.interpolate import interp1d
+
         if self.mooring_type == "SemiTaut":
             # Interpolation of line cost at project depth
             line_cost = interp1d(
@@ -130,15 +130,17 @@ class MooredSubInstallation(InstallPhase):
 
         to_assemble = [1] * self.num_turbines
 
-        self.sub_assembly_lines = []
+        # Hoisted out of the loop for ports with many assembly lines
+        register = self.env.register
+        wet_storage = self.wet_storage
+
+        self.sub_assembly_lines = sub_assembly_lines = []
         for i in range(lines):
-            a = SubstructureAssemblyLine(
-                to_assemble, time, self.wet_storage, i + 1
-            )
+            a = SubstructureAssemblyLine(to_assemble, time, wet_storage, i + 1)
 
-            self.env.register(a)
+            register(a)
             a.start()
-            self.sub_assembly_lines.append(a)
+            sub_assembly_lines.append(a)
 
     def initialize_turbine_assembly(self):
         """
@@ -163,15 +165,21 @@ class MooredSubInstallation(InstallPhase):
             lines = 1
 
         turbine = self.config["turbine"]
-        self.turbine_assembly_lines = []
+
+        # Hoisted out of the loop for ports with many assembly cranes
+        register = self.env.register
+        wet_storage = self.wet_storage
+        assembly_storage = self.assembly_storage
+
+        self.turbine_assembly_lines = turbine_assembly_lines = []
         for i in range(lines):
             a = TurbineAssemblyLine(
-                self.wet_storage, self.assembly_storage, turbine, i + 1
+                wet_storage, assembly_storage, turbine, i + 1
             )
 
-            self.env.register(a)
+            register(a)
             a.start()
-            self.turbine_assembly_lines.append(a)
+            turbine_assembly_lines.append(a)
 
     def initialize_towing_groups(self, **kwargs):
         """
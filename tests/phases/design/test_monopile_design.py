@@ -60,6 +60,139 @@ def test_paramater_sweep(depth, mean_ws, turbine):
     assert 4 < m._outputs["transition_piece"]["diameter"] < 14
 
 
+def test_sequential_small_to_large_designs():
+    """
+    Designing a small monopile must not affect subsequent designs in the
+    same process (regression for a warm-started diameter solve that
+    collapsed onto a spurious near-zero root).
+    """
+
+    small = {
+        "site": {"depth": 5, "mean_windspeed": 7},
+        "plant": {"num_turbines": 20},
+        "turbine": {
+            "rotor_diameter": 90,
+            "hub_height": 70,
+            "rated_windspeed": 13,
+        },
+    }
+
+    large = {
+        "site": {"depth": 50, "mean_windspeed": 11},
+        "plant": {"num_turbines": 20},
+        "turbine": {
+            "rotor_diameter": 220,
+            "hub_height": 150,
+            "rated_windspeed": 9,
+        },
+    }
+
+    m = MonopileDesign(small)
+    m.run()
+    assert 4 < m._outputs["monopile"]["diameter"] < 5
+
+    m = MonopileDesign(large)
+    m.run()
+    assert 11 < m._outputs["monopile"]["diameter"] < 13
+
+
+def test_design_monopile_batch():
+
+    m = MonopileDesign(base)
+
+    depths = [10, 30, 50]
+    mean_ws = [8, 9, 10]
+
+    batch = m.design_monopile_batch(
+        mean_windspeed=mean_ws,
+        site_depth=depths,
+        rotor_diameter=150,
+        hub_height=110,
+        rated_windspeed=11,
+    )
+
+    for i, (depth, ws) in enumerate(zip(depths, mean_ws)):
+
+        scalar = m.design_monopile(
+            mean_windspeed=ws,
+            site_depth=depth,
+            rotor_diameter=150,
+            hub_height=110,
+            rated_windspeed=11,
+        )
+
+        for k, v in scalar.items():
+            assert batch[k][i] == pytest.approx(v)
+
+
+def test_design_monopile_array():
+
+    m = MonopileDesign(base)
+
+    depths = [10, 30, 50]
+    mean_ws = [8, 9, 10]
+
+    batch = m.design_monopile_batch(
+        mean_windspeed=mean_ws,
+        site_depth=depths,
+        rotor_diameter=150,
+        hub_height=110,
+        rated_windspeed=11,
+    )
+
+    array = m.design_monopile_array(
+        mean_windspeed=mean_ws,
+        site_depth=depths,
+        rotor_diameter=150,
+        hub_height=110,
+        rated_windspeed=11,
+    )
+
+    for k, v in batch.items():
+        assert array[k] == pytest.approx(v)
+
+
+def test_design_monopile_batch_config_params():
+
+    config = deepcopy(base)
+    config["monopile_design"] = {"material_factor": 1.3, "airgap": 12}
+
+    m = MonopileDesign(config)
+
+    depths = [10, 30, 50]
+    mean_ws = [8, 9, 10]
+
+    batch = m.design_monopile_batch(
+        mean_windspeed=mean_ws,
+        site_depth=depths,
+        rotor_diameter=150,
+        hub_height=110,
+        rated_windspeed=11,
+    )
+
+    array = m.design_monopile_array(
+        mean_windspeed=mean_ws,
+        site_depth=depths,
+        rotor_diameter=150,
+        hub_height=110,
+        rated_windspeed=11,
+    )
+
+    for i, (depth, ws) in enumerate(zip(depths, mean_ws)):
+
+        scalar = m.design_monopile(
+            mean_windspeed=ws,
+            site_depth=depth,
+            rotor_diameter=150,
+            hub_height=110,
+            rated_windspeed=11,
+        )
+
+        for k, v in scalar.items():
+            assert batch[k][i] == pytest.approx(v)
+            assert array[k][i] == pytest.approx(v)
+
+
 def test_monopile_kwargs():
 
     test_kwargs = {